@@ -1,11 +1,13 @@
 /**
  * File-backed JSON database with file locking.
  *
- * Uses proper-lockfile for cross-process safe file locking.
+ * Uses proper-lockfile for cross-process safe file locking; updates are
+ * written to a temp file and renamed into place.
  * DB_FILE = data/instances.json
  */
 
 import { readFileSync, writeFileSync, existsSync, mkdirSync } from "node:fs";
+import { open, readFile, rename, stat } from "node:fs/promises";
 import { resolve, dirname } from "node:path";
 import lockfile from "proper-lockfile";
 
@@ -46,14 +48,90 @@ export function loadDb(): DB {
   }
 }
 
+/**
+ * Replace DB_FILE atomically: write a temp file, fsync it, rename it over,
+ * then fsync the directory so the rename itself survives a power loss.
+ * A crash mid-write leaves the old DB intact, and lock-free readers
+ * (loadDb) see either the old or the new contents, never a partial file.
+ *
+ * The DB holds gateway and bot tokens, so the temp file is created 0600 and
+ * then given the existing file's mode (keeping any operator chmod).
+ */
+async function replaceDbFile(contents: string): Promise<void> {
+  const tmp = `${DB_FILE}.tmp`;
+  let mode = 0o600;
+  try {
+    mode = (await stat(DB_FILE)).mode & 0o777;
+  } catch {
+    // No existing file — keep the private default
+  }
+
+  const fh = await open(tmp, "w", 0o600);
+  try {
+    await fh.chmod(mode);
+    await fh.writeFile(contents);
+    await fh.sync();
+  } finally {
+    await fh.close();
+  }
+  await rename(tmp, DB_FILE);
+
+  const dir = await open(DATA_DIR, "r");
+  try {
+    await dir.sync();
+  } finally {
+    await dir.close();
+  }
+}
+
+/** Tail of the in-process queue of withLockedDb callers. */
+let lockQueue: Promise<unknown> = Promise.resolve();
+
+/** How long a caller may wait in the queue before failing like ELOCKED. */
+const LOCK_QUEUE_TIMEOUT_MS = 15_000;
+
+function lockTimeoutError(): Error {
+  return Object.assign(new Error("Timed out waiting for the instances DB lock"), { code: "ELOCKED" });
+}
+
 /**
  * Acquire file lock, read DB, call fn, write result, release lock.
  * Returns whatever fn returns.
+ *
+ * Callers in this process are queued and take the file lock one at a time,
+ * so a long launch holding the lock makes others wait rather than burn
+ * through lockfile's retries. A caller still waiting after
+ * LOCK_QUEUE_TIMEOUT_MS (e.g. behind a hung Docker call) is rejected with
+ * ELOCKED and its fn never runs.
  */
-export async function withLockedDb<T>(fn: (db: DB) => T | Promise<T>): Promise<T> {
+export function withLockedDb<T>(fn: (db: DB) => T | Promise<T>): Promise<T> {
+  let started = false;
+  let expired = false;
+
+  const run = lockQueue.then(() => {
+    if (expired) throw lockTimeoutError();
+    started = true;
+    return withFileLock(fn);
+  });
+  lockQueue = run.catch(() => {});
+
+  return new Promise<T>((resolve, reject) => {
+    const timer = setTimeout(() => {
+      if (started) return;
+      expired = true;
+      reject(lockTimeoutError());
+    }, LOCK_QUEUE_TIMEOUT_MS);
+    run.then(
+      (value) => { clearTimeout(timer); resolve(value); },
+      (err) => { clearTimeout(timer); reject(err); },
+    );
+  });
+}
+
+async function withFileLock<T>(fn: (db: DB) => T | Promise<T>): Promise<T> {
   // Ensure the file exists before locking
   if (!existsSync(DB_FILE)) {
-    writeFileSync(DB_FILE, JSON.stringify({ instances: {} }, null, 2));
+    writeFileSync(DB_FILE, JSON.stringify({ instances: {} }), { mode: 0o600 });
   }
 
   const release = await lockfile.lock(DB_FILE, {
@@ -62,10 +140,16 @@ export async function withLockedDb<T>(fn: (db: DB) => T | Promise<T>): Promise<T
   });
 
   try {
-    const raw = readFileSync(DB_FILE, "utf-8").trim();
+    const raw = (await readFile(DB_FILE, "utf-8")).trim();
     const db: DB = raw ? (JSON.parse(raw) as DB) : { instances: {} };
+    const before = JSON.stringify(db);
     const result = await fn(db);
-    writeFileSync(DB_FILE, JSON.stringify(db, null, 2));
+    // Most lock holders (409 already-running, failed launches, destroy of an
+    // unknown id) leave the DB untouched — skip rewriting the file for them
+    const after = JSON.stringify(db);
+    if (after !== before) {
+      await replaceDbFile(after);
+    }
     return result;
   } finally {
     await release();
@@ -3,11 +3,18 @@
  */
 
 import { createHash } from "node:crypto";
+import { access, readFile } from "node:fs/promises";
+import { Agent } from "node:http";
 import Dockerode from "dockerode";
 import type { Readable } from "node:stream";
 import { getProxyPort } from "./proxy.js";
 
-const docker = new Dockerode({ socketPath: "/var/run/docker.sock" });
+// Keep-alive pool on the Docker socket. maxSockets stays unlimited: stats and
+// followed log streams each hold a socket for their lifetime, and a cap would
+// leave inspect/start/stop queued behind them.
+const dockerAgent = new Agent({ keepAlive: true, maxFreeSockets: 16 });
+
+const docker = new Dockerode({ socketPath: "/var/run/docker.sock", agent: dockerAgent } as Dockerode.DockerOptions);
 
 // Constants
 export const OPENCLAW_IMAGE = "openclaw:local";
@@ -15,68 +22,372 @@ const TAILSCALE_IP = process.env.TAILSCALE_IP || "100.118.141.107";
 const PROXY_NETWORK_NAME = "openclaw-proxy-net";
 const PROXY_NETWORK_SUBNET = "172.28.0.0/16";
 const PROXY_NETWORK_GATEWAY = "172.28.0.1";
+const CONTAINER_PREFIX = "openclaw-";
 
 /** Cached gateway IP for the proxy network. */
 let proxyNetworkGateway: string | null = null;
 
+/** How long an observed container status is reused before re-inspecting. */
+const STATUS_TTL_MS = 2000;
+
+/** Full container ID per name, learned from inspect/list (locates cgroup files). */
+const containerIds = new Map<string, string>();
+
+/** Bound on cached statuses — /api/stats/:id looks up caller-supplied names. */
+const STATUS_CACHE_MAX = 256;
+
+/** Recently observed status per container name (lifecycle calls invalidate). */
+const statusLookupCache = new Map<string, { status: string; expires: number }>();
+
+/**
+ * Bumped on every invalidation. A lookup that started before a lifecycle
+ * change must not cache what it saw (e.g. "running" from just before a stop).
+ */
+let statusEpoch = 0;
+
+function rememberStatus(name: string, status: string, epoch: number): void {
+  if (epoch !== statusEpoch) return;
+  if (statusLookupCache.size >= STATUS_CACHE_MAX) {
+    const now = Date.now();
+    for (const [key, entry] of statusLookupCache) {
+      if (entry.expires <= now) statusLookupCache.delete(key);
+    }
+    if (statusLookupCache.size >= STATUS_CACHE_MAX) {
+      // Still full — evict the oldest entry (Map iterates in insertion order)
+      statusLookupCache.delete(statusLookupCache.keys().next().value as string);
+    }
+  }
+  statusLookupCache.set(name, { status, expires: Date.now() + STATUS_TTL_MS });
+}
+
+/**
+ * Drop the cached status for a container so the next lookup hits dockerd.
+ */
+export function invalidateContainerStatus(name: string): void {
+  statusEpoch++;
+  statusLookupCache.delete(name);
+}
+
+/** Memoised walletToId results, bounded since pubkeys come from request bodies. */
+const WALLET_ID_CACHE_MAX = 4096;
+const walletIds = new Map<string, string>();
+
 /**
  * Deterministic short ID from wallet pubkey — sha256 hex[:12].
  */
 export function walletToId(pubkey: string): string {
-  return createHash("sha256").update(pubkey).digest("hex").slice(0, 12);
+  let id = walletIds.get(pubkey);
+  if (id === undefined) {
+    id = createHash("sha256").update(pubkey).digest("hex").slice(0, 12);
+    if (walletIds.size >= WALLET_ID_CACHE_MAX) {
+      // Evict the oldest entry (Map iterates in insertion order)
+      walletIds.delete(walletIds.keys().next().value as string);
+    }
+    walletIds.set(pubkey, id);
+  }
+  return id;
 }
 
 /**
  * Container name from instance ID.
  */
 export function containerName(id: string): string {
-  return `openclaw-${id}`;
+  return `${CONTAINER_PREFIX}${id}`;
 }
 
 /**
  * Get live container status string.
+ * Served from a short TTL cache when the container was looked up recently,
+ * unless `fresh` is set. The cache only sees lifecycle calls made through
+ * this launcher (not crashes, restart-policy restarts or `docker stop`), so
+ * callers that act on the status should pass fresh = true.
  */
-export async function getContainerStatus(name: string): Promise<string> {
+export async function getContainerStatus(name: string, fresh = false): Promise<string> {
+  const cached = statusLookupCache.get(name);
+  if (cached) {
+    if (!fresh && cached.expires > Date.now()) return cached.status;
+    statusLookupCache.delete(name);
+  }
+
+  const epoch = statusEpoch;
   try {
     const container = docker.getContainer(name);
     const info = await container.inspect();
-    return info.State?.Status || "unknown";
+    const status = info.State?.Status || "unknown";
+    containerIds.set(name, info.Id);
+    rememberStatus(name, status, epoch);
+    return status;
   } catch (err: any) {
-    if (err.statusCode === 404) return "not_found";
+    if (err.statusCode === 404) {
+      rememberStatus(name, "not_found", epoch);
+      return "not_found";
+    }
     return "docker_unreachable";
   }
 }
 
+/**
+ * Status of every openclaw container in a single list call, keyed by name.
+ * Containers missing from the map don't exist. Also refreshes the status cache.
+ */
+export async function listContainerStatuses(): Promise<Map<string, string>> {
+  const epoch = statusEpoch;
+  const containers = await docker.listContainers({
+    all: true,
+    filters: { name: [CONTAINER_PREFIX] },
+  });
+  const statuses = new Map<string, string>();
+  for (const c of containers) {
+    for (const raw of c.Names || []) {
+      const name = raw.replace(/^\//, "");
+      containerIds.set(name, c.Id);
+      statuses.set(name, c.State || "unknown");
+      rememberStatus(name, c.State || "unknown", epoch);
+    }
+  }
+  return statuses;
+}
+
+export interface ContainerUsage {
+  cpuPercent: number;
+  memoryBytes: number;
+  memoryLimit: number;
+}
+
+/** A streamed sample older than this is treated as stale. */
+const STATS_STALE_MS = 5000;
+
+interface StatsWatch {
+  stream: Readable | null;
+  latest: any | null;
+  received: number;
+}
+
+/** One long-lived `docker stats` stream per running container. */
+const statsWatches = new Map<string, StatsWatch>();
+
+/** Last one-shot sample per container, the CPU baseline for the next one. */
+const oneShotSamples = new Map<string, any>();
+
+/** one-shot skips dockerd's ~1 s wait for a second sample (precpu_stats comes back empty). */
+const ONE_SHOT_STATS = { stream: false as const, "one-shot": true };
+
+/**
+ * Start streaming stats for a container (no-op if already streaming).
+ * dockerd pushes a sample roughly every second; only the newest is kept.
+ */
+function watchStats(name: string): StatsWatch {
+  const existing = statsWatches.get(name);
+  if (existing) return existing;
+
+  const watch: StatsWatch = { stream: null, latest: null, received: 0 };
+  statsWatches.set(name, watch);
+
+  docker.getContainer(name).stats({ stream: true })
+    .then((raw) => {
+      const stream = raw as unknown as Readable;
+      if (statsWatches.get(name) !== watch) {
+        // Unwatched while the request was in flight
+        stream.destroy();
+        return;
+      }
+      watch.stream = stream;
+
+      let pending = "";
+      stream.on("data", (chunk: Buffer | string) => {
+        pending += chunk.toString();
+        let nl: number;
+        while ((nl = pending.indexOf("\n")) >= 0) {
+          const line = pending.slice(0, nl).trim();
+          pending = pending.slice(nl + 1);
+          if (!line) continue;
+          try {
+            watch.latest = JSON.parse(line);
+            watch.received = Date.now();
+          } catch {
+            // Partial or malformed sample — wait for the next one
+          }
+        }
+      });
+      const done = () => {
+        if (statsWatches.get(name) === watch) statsWatches.delete(name);
+      };
+      stream.on("end", done);
+      stream.on("close", done);
+      stream.on("error", done);
+    })
+    .catch(() => {
+      if (statsWatches.get(name) === watch) statsWatches.delete(name);
+    });
+
+  return watch;
+}
+
+/**
+ * Stop streaming stats for a container.
+ */
+export function unwatchStats(name: string): void {
+  const watch = statsWatches.get(name);
+  if (!watch) return;
+  statsWatches.delete(name);
+  oneShotSamples.delete(name);
+  watch.stream?.destroy();
+}
+
+const CGROUP_ROOT = "/sys/fs/cgroup";
+
+/** Previous cgroup CPU reading per container, both in microseconds. */
+const cgroupCpuSamples = new Map<string, { usageUsec: number; wallUsec: number }>();
+
+/**
+ * Resolved cgroup directory per container name (null = not visible), valid
+ * while the container ID matches. Cleared on launch/start/destroy.
+ */
+const cgroupDirs = new Map<string, { id: string; dir: string | null }>();
+
+async function cgroupDir(name: string, id: string): Promise<string | null> {
+  const cached = cgroupDirs.get(name);
+  if (cached && cached.id === id) return cached.dir;
+
+  const candidates = [
+    `${CGROUP_ROOT}/system.slice/docker-${id}.scope`, // systemd cgroup driver
+    `${CGROUP_ROOT}/docker/${id}`,                    // cgroupfs driver
+  ];
+  let dir: string | null = null;
+  for (const candidate of candidates) {
+    try {
+      await access(`${candidate}/cpu.stat`);
+      dir = candidate;
+      break;
+    } catch {
+      // Not this layout
+    }
+  }
+  cgroupDirs.set(name, { id, dir });
+  return dir;
+}
+
+/**
+ * Read usage straight from the container's cgroup v2 files — no dockerd
+ * round trip. CPU% is measured against the previous read for the container.
+ * Returns null when the files aren't visible (launcher running inside a
+ * container, cgroup v1, Docker Desktop), so callers fall back to the API.
+ */
+async function readCgroupUsage(name: string): Promise<ContainerUsage | null> {
+  const id = containerIds.get(name);
+  if (!id) return null;
+  const dir = await cgroupDir(name, id);
+  if (!dir) return null;
+
+  try {
+    const [cpuStat, memCurrent, memMax] = await Promise.all([
+      readFile(`${dir}/cpu.stat`, "utf-8"),
+      readFile(`${dir}/memory.current`, "utf-8"),
+      readFile(`${dir}/memory.max`, "utf-8"),
+    ]);
+    const match = /^usage_usec (\d+)$/m.exec(cpuStat);
+    if (!match) return null;
+
+    const usageUsec = Number(match[1]);
+    const wallUsec = Number(process.hrtime.bigint() / 1000n);
+    const prev = cgroupCpuSamples.get(name);
+    cgroupCpuSamples.set(name, { usageUsec, wallUsec });
+
+    // First read only sets the baseline — let the API path report a real CPU%
+    if (!prev || wallUsec <= prev.wallUsec || usageUsec < prev.usageUsec) return null;
+    const cpuPercent = ((usageUsec - prev.usageUsec) / (wallUsec - prev.wallUsec)) * 100;
+
+    return {
+      cpuPercent,
+      memoryBytes: Number(memCurrent.trim()) || 0,
+      memoryLimit: memMax.trim() === "max" ? 0 : Number(memMax.trim()) || 0,
+    };
+  } catch {
+    // Directory went away (container stopped/recreated) — resolve again next time
+    cgroupDirs.delete(name);
+    return null;
+  }
+}
+
+function usageFromSample(stats: any): ContainerUsage {
+  const cpuStats = stats.cpu_stats || {};
+  const precpuStats = stats.precpu_stats || {};
+  const cpuDelta =
+    (cpuStats.cpu_usage?.total_usage || 0) -
+    (precpuStats.cpu_usage?.total_usage || 0);
+  const systemDelta =
+    (cpuStats.system_cpu_usage || 0) -
+    (precpuStats.system_cpu_usage || 0);
+  // Same scaling as the docker CLI (percent of one core) — matches the cgroup
+  // path; cgroup v2 leaves percpu_usage empty, so prefer online_cpus
+  const cpuCount = cpuStats.online_cpus || cpuStats.cpu_usage?.percpu_usage?.length || 1;
+
+  let cpuPercent = 0;
+  // The first streamed sample has an empty precpu_stats — no delta to report yet
+  if (precpuStats.system_cpu_usage && systemDelta > 0 && cpuDelta > 0) {
+    cpuPercent = (cpuDelta / systemDelta) * cpuCount * 100;
+  }
+
+  return {
+    cpuPercent,
+    memoryBytes: stats.memory_stats?.usage || 0,
+    memoryLimit: stats.memory_stats?.limit || 0,
+  };
+}
+
+/**
+ * CPU/memory usage for a running container.
+ *
+ * Read from the container's cgroup files when the host exposes them.
+ * Otherwise served from the container's stats stream, started on first use.
+ * Until the stream has a fresh sample (or if it has gone quiet for longer
+ * than STATS_STALE_MS) this falls back to a one-shot stats request, with CPU
+ * measured against the previous sample we saw, and restarts the stream.
+ * With no previous sample at all, it pays for one regular two-sample read
+ * so the first CPU% is real rather than 0.
+ */
+export async function getContainerUsage(name: string): Promise<ContainerUsage> {
+  const fromCgroup = await readCgroupUsage(name);
+  if (fromCgroup) {
+    // A stream may have been started for the baseline read — no longer needed
+    unwatchStats(name);
+    return fromCgroup;
+  }
+
+  const watch = watchStats(name);
+  if (watch.latest && Date.now() - watch.received < STATS_STALE_MS) {
+    return usageFromSample(watch.latest);
+  }
+
+  const previous = watch.latest || oneShotSamples.get(name);
+  if (watch.latest) {
+    // Stream went quiet — drop it so the next call reconnects
+    unwatchStats(name);
+  }
+
+  if (!previous) {
+    const stats = (await docker.getContainer(name).stats({ stream: false })) as any;
+    oneShotSamples.set(name, stats);
+    return usageFromSample(stats);
+  }
+
+  const stats = (await docker.getContainer(name).stats(ONE_SHOT_STATS)) as any;
+  oneShotSamples.set(name, stats);
+  stats.precpu_stats = previous.cpu_stats;
+  return usageFromSample(stats);
+}
+
 /**
  * Get CPU/memory stats for a running container.
  */
 export async function getContainerStats(name: string): Promise<Record<string, string>> {
   try {
-    const container = docker.getContainer(name);
-    const stats = await container.stats({ stream: false }) as any;
-
-    const cpuStats = stats.cpu_stats || {};
-    const precpuStats = stats.precpu_stats || {};
-    const cpuDelta =
-      (cpuStats.cpu_usage?.total_usage || 0) -
-      (precpuStats.cpu_usage?.total_usage || 0);
-    const systemDelta =
-      (cpuStats.system_cpu_usage || 0) -
-      (precpuStats.system_cpu_usage || 0);
-    const cpuCount = (cpuStats.cpu_usage?.percpu_usage?.length || 1);
-
-    let cpuPercent = 0;
-    if (systemDelta > 0 && cpuDelta > 0) {
-      cpuPercent = (cpuDelta / systemDelta) * cpuCount * 100;
-    }
-
-    const memUsage = stats.memory_stats?.usage || 0;
-    const memLimit = stats.memory_stats?.limit || 0;
-    const memPercent = memLimit ? (memUsage / memLimit * 100) : 0;
+    const usage = await getContainerUsage(name);
+    const memPercent = usage.memoryLimit ? (usage.memoryBytes / usage.memoryLimit * 100) : 0;
 
     return {
-      cpu: `${cpuPercent.toFixed(2)}%`,
-      mem: `${formatBytes(memUsage)} / ${formatBytes(memLimit)}`,
+      cpu: `${usage.cpuPercent.toFixed(2)}%`,
+      mem: `${formatBytes(usage.memoryBytes)} / ${formatBytes(usage.memoryLimit)}`,
       mem_pct: `${memPercent.toFixed(2)}%`,
     };
   } catch (err: any) {
@@ -228,6 +539,10 @@ export async function launchContainer(params: LaunchParams): Promise<Dockerode.C
   });
 
   await container.start();
+  containerIds.set(params.name, container.id);
+  cgroupDirs.delete(params.name);
+  cgroupCpuSamples.delete(params.name);
+  invalidateContainerStatus(params.name);
   return container;
 }
 
@@ -236,7 +551,12 @@ export async function launchContainer(params: LaunchParams): Promise<Dockerode.C
  */
 export async function startContainer(name: string): Promise<void> {
   const container = docker.getContainer(name);
-  await container.start();
+  try {
+    await container.start();
+  } finally {
+    cgroupDirs.delete(name);
+    invalidateContainerStatus(name);
+  }
 }
 
 /**
@@ -244,7 +564,12 @@ export async function startContainer(name: string): Promise<void> {
  */
 export async function stopContainer(name: string): Promise<void> {
   const container = docker.getContainer(name);
-  await container.stop({ t: 30 });
+  unwatchStats(name);
+  try {
+    await container.stop({ t: 30 });
+  } finally {
+    invalidateContainerStatus(name);
+  }
 }
 
 /**
@@ -252,14 +577,28 @@ export async function stopContainer(name: string): Promise<void> {
  */
 export async function destroyContainer(name: string): Promise<void> {
   const container = docker.getContainer(name);
+  unwatchStats(name);
   try {
     await container.stop({ t: 15 });
   } catch {
     // Already stopped or not running — fine
   }
-  await container.remove({ force: true });
+  try {
+    await container.remove({ force: true });
+  } finally {
+    containerIds.delete(name);
+    cgroupDirs.delete(name);
+    cgroupCpuSamples.delete(name);
+    invalidateContainerStatus(name);
+  }
 }
 
+/** Characters of log output returned by the HTTP tail. */
+const LOG_TAIL_CHARS = 5000;
+
+/** Bytes decoded for the tail — worst case of 4 UTF-8 bytes per character. */
+const LOG_TAIL_BYTES = LOG_TAIL_CHARS * 4;
+
 /**
  * Get container logs (tail N lines).
  */
@@ -270,9 +609,18 @@ export async function getContainerLogs(name: string, lines: number): Promise<str
     stderr: true,
     tail: lines,
   });
-  // Dockerode returns Buffer or string
-  const text = typeof buffer === "string" ? buffer : buffer.toString("utf-8");
-  return text.slice(-5000);
+  // Dockerode returns Buffer or string. Trim the Buffer before decoding so a
+  // chatty container's tail doesn't get decoded in full just to be sliced.
+  let text: string;
+  if (typeof buffer === "string") {
+    text = buffer;
+  } else {
+    let start = Math.max(0, buffer.length - LOG_TAIL_BYTES);
+    // Don't start mid-character: skip UTF-8 continuation bytes (10xxxxxx)
+    while (start < buffer.length && (buffer[start] & 0xc0) === 0x80) start++;
+    text = buffer.subarray(start).toString("utf-8");
+  }
+  return text.slice(-LOG_TAIL_CHARS);
 }
 
 /**
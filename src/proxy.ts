@@ -224,8 +224,29 @@ function identifySource(remoteAddress: string | undefined): string {
 // Proxy server
 // ---------------------------------------------------------------------------
 
+const LISTEN_BACKLOG = 1024;
+const TUNNEL_KEEPALIVE_MS = 60_000;
+
 let proxyServer: ReturnType<typeof createServer> | null = null;
 
+/**
+ * Join two sockets into a bidirectional tunnel.
+ *
+ * Each direction is a plain stream pipe on the event loop — pipe() already
+ * pauses the reader while the writer is draining, so a tunnel costs two
+ * socket handles and no threads or extra copies beyond the kernel reads.
+ * Error teardown is the caller's job (handleConnect destroys the peer).
+ */
+function tunnel(a: Socket, b: Socket): void {
+  for (const s of [a, b]) {
+    // Streaming model responses are many small writes — don't let Nagle hold them.
+    s.setNoDelay(true);
+    s.setKeepAlive(true, TUNNEL_KEEPALIVE_MS);
+  }
+  a.pipe(b);
+  b.pipe(a);
+}
+
 /**
  * Handle HTTP CONNECT requests (HTTPS tunneling).
  */
@@ -257,6 +278,7 @@ function handleConnect(
   // Resolve hostname and check for DNS rebinding
   resolveAndCheck(hostname)
     .then((resolvedIP) => {
+      let established = false;
       const serverSocket = netConnect(port, resolvedIP, () => {
         clientSocket.write(
           "HTTP/1.1 200 Connection Established\r\n" +
@@ -264,17 +286,18 @@ function handleConnect(
           "\r\n"
         );
         recordAllowed();
+        established = true;
 
-        // Pipe data bidirectionally
-        serverSocket.write(head);
-        serverSocket.pipe(clientSocket);
-        clientSocket.pipe(serverSocket);
+        if (head.length > 0) serverSocket.write(head);
+        tunnel(clientSocket, serverSocket);
       });
 
       serverSocket.on("error", (err) => {
         console.error(`[proxy] CONNECT tunnel error to ${hostname}:${port}: ${err.message}`);
         if (!clientSocket.destroyed) {
-          clientSocket.write("HTTP/1.1 502 Bad Gateway\r\n\r\n");
+          // Only answer with a status line before the tunnel is up — afterwards
+          // the client is speaking TLS and a plaintext 502 would corrupt it.
+          if (!established) clientSocket.write("HTTP/1.1 502 Bad Gateway\r\n\r\n");
           clientSocket.destroy();
         }
       });
@@ -390,7 +413,11 @@ export function startProxy(config?: Partial<ProxyConfig>): void {
     console.error(`[proxy] Server error: ${err.message}`);
   });
 
-  proxyServer.listen(proxyConfig.port, proxyConfig.bindAddress, () => {
+  proxyServer.listen({
+    port: proxyConfig.port,
+    host: proxyConfig.bindAddress,
+    backlog: LISTEN_BACKLOG,
+  }, () => {
     console.log(
       `[proxy] Egress proxy listening on ${proxyConfig.bindAddress}:${proxyConfig.port}`
     );
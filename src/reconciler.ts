@@ -6,11 +6,8 @@
  */
 
 import { loadDb } from "./db.js";
-import { containerName, getContainerStatus } from "./docker.js";
+import { containerName, getContainerUsage, listContainerStatuses } from "./docker.js";
 import { isProxyRunning } from "./proxy.js";
-import Dockerode from "dockerode";
-
-const docker = new Dockerode({ socketPath: "/var/run/docker.sock" });
 
 export interface StatusEntry {
   status: string;
@@ -47,84 +44,76 @@ async function reconcileOnce(): Promise<void> {
     }
   }
 
-  for (const iid of currentIds) {
-    const cname = containerName(iid);
+  // One list call for every container instead of an inspect per instance
+  let statuses: Map<string, string>;
+  try {
+    statuses = await listContainerStatuses();
+  } catch (err: any) {
+    console.error("Health reconciler: DockerException listing containers:", err.message || err);
+    return;
+  }
+
+  // Instances are independent — collect them concurrently so a pass takes
+  // one stats round trip, not one per running instance
+  await Promise.all([...currentIds].map((iid) => reconcileInstance(iid, statuses)));
+}
+
+/**
+ * Update the status cache entry for one instance from the container list.
+ */
+async function reconcileInstance(iid: string, statuses: Map<string, string>): Promise<void> {
+  const cname = containerName(iid);
+  const newStatus = statuses.get(cname);
+
+  const prev = statusCache.get(iid);
+  const prevStatus = prev?.status || "unknown";
+
+  if (newStatus === undefined) {
+    if (prevStatus !== "not_found" && prevStatus !== "unknown") {
+      console.warn(
+        `Health reconciler: container ${cname} for instance ${iid} is gone (was ${prevStatus})`
+      );
+    }
+    statusCache.set(iid, {
+      status: "not_found",
+      cpu_percent: 0,
+      memory_bytes: 0,
+      updated: Date.now() / 1000,
+    });
+    return;
+  }
+
+  // Detect unexpected stop (was running, now dead/exited)
+  if (
+    prevStatus === "running" &&
+    ["exited", "dead", "removing"].includes(newStatus)
+  ) {
+    console.warn(
+      `Health reconciler: instance ${iid} container ${cname} transitioned ${prevStatus} → ${newStatus}`
+    );
+    restartCounters.set(iid, (restartCounters.get(iid) || 0) + 1);
+  }
+
+  // Collect CPU/memory for running containers
+  let cpuPercent = 0;
+  let memoryBytes = 0;
 
+  if (newStatus === "running") {
     try {
-      const container = docker.getContainer(cname);
-      const info = await container.inspect();
-      const newStatus = info.State?.Status || "unknown";
-
-      // Detect unexpected stop (was running, now dead/exited)
-      const prev = statusCache.get(iid);
-      const prevStatus = prev?.status || "unknown";
-
-      if (
-        prevStatus === "running" &&
-        ["exited", "dead", "removing"].includes(newStatus)
-      ) {
-        console.warn(
-          `Health reconciler: instance ${iid} container ${cname} transitioned ${prevStatus} → ${newStatus}`
-        );
-        restartCounters.set(iid, (restartCounters.get(iid) || 0) + 1);
-      }
-
-      // Collect CPU/memory for running containers
-      let cpuPercent = 0;
-      let memoryBytes = 0;
-
-      if (newStatus === "running") {
-        try {
-          const stats = (await container.stats({ stream: false })) as any;
-          const cpuStats = stats.cpu_stats || {};
-          const precpuStats = stats.precpu_stats || {};
-          const cpuDelta =
-            (cpuStats.cpu_usage?.total_usage || 0) -
-            (precpuStats.cpu_usage?.total_usage || 0);
-          const systemDelta =
-            (cpuStats.system_cpu_usage || 0) -
-            (precpuStats.system_cpu_usage || 0);
-          const cpuCount =
-            cpuStats.cpu_usage?.percpu_usage?.length || 1;
-
-          if (systemDelta > 0 && cpuDelta > 0) {
-            cpuPercent = (cpuDelta / systemDelta) * cpuCount * 100;
-          }
-          memoryBytes = stats.memory_stats?.usage || 0;
-        } catch {
-          // Stats collection failed — keep defaults
-        }
-      }
-
-      statusCache.set(iid, {
-        status: newStatus,
-        cpu_percent: cpuPercent,
-        memory_bytes: memoryBytes,
-        updated: Date.now() / 1000,
-      });
-    } catch (err: any) {
-      if (err.statusCode === 404) {
-        const prev = statusCache.get(iid);
-        const prevStatus = prev?.status || "unknown";
-        if (prevStatus !== "not_found" && prevStatus !== "unknown") {
-          console.warn(
-            `Health reconciler: container ${cname} for instance ${iid} is gone (was ${prevStatus})`
-          );
-        }
-        statusCache.set(iid, {
-          status: "not_found",
-          cpu_percent: 0,
-          memory_bytes: 0,
-          updated: Date.now() / 1000,
-        });
-      } else {
-        console.error(
-          `Health reconciler: DockerException for ${iid}:`,
-          err.message || err
-        );
-      }
+      const usage = await getContainerUsage(cname);
+      cpuPercent = usage.cpuPercent;
+      memoryBytes = usage.memoryBytes;
+    } catch {
+      // Stats collection failed — keep defaults
     }
   }
+
+  statusCache.set(iid, {
+    status: newStatus,
+    cpu_percent: cpuPercent,
+    memory_bytes: memoryBytes,
+    updated: Date.now() / 1000,
+  });
 }
 
 /**
@@ -5,10 +5,16 @@
  * TypeScript/Express rewrite of the original Python/Flask server.
  */
 
+// The egress proxy resolves every CONNECT target with dns.lookup(), which runs
+// on libuv's threadpool (4 threads by default) alongside fs work. The pool is
+// sized on first use, so this must run before any async fs/dns call.
+process.env.UV_THREADPOOL_SIZE ??= "16";
+
 import express from "express";
 import { createServer } from "node:http";
 import { WebSocketServer, WebSocket } from "ws";
-import { readFileSync, existsSync, mkdirSync, readdirSync, writeFileSync, copyFileSync, chownSync, rmSync } from "node:fs";
+import { readFileSync, existsSync, mkdirSync, readdirSync, writeFileSync, copyFileSync, chownSync, rmSync, statSync } from "node:fs";
+import { readFile, writeFile } from "node:fs/promises";
 import { resolve, join } from "node:path";
 import { randomBytes } from "node:crypto";
 import { Marked } from "marked";
@@ -136,30 +142,45 @@ app.get("/", (_req, res) => {
   res.sendFile(resolve("public", "index.html"));
 });
 
-// Docs page — render README.md as HTML in the docs template
-app.get("/docs", (_req, res) => {
-  const readmePath = resolve(BASE_DIR, "README.md");
-  if (!existsSync(readmePath)) {
-    res.status(404).send("Documentation not found");
-    return;
-  }
+/** Rendered /docs page, rebuilt only when README.md or the docs template changes. */
+let docsCache: { key: string; html: string } | null = null;
+
+function renderDocs(readmePath: string): string {
+  const templatePath = resolve("public", "docs.html");
+  const hasTemplate = existsSync(templatePath);
+  const key = `${statSync(readmePath).mtimeMs}:${hasTemplate ? statSync(templatePath).mtimeMs : 0}`;
+  if (docsCache?.key === key) return docsCache.html;
 
   const readmeContent = readFileSync(readmePath, "utf-8");
   const marked = new Marked();
   const htmlContent = marked.parse(readmeContent) as string;
 
-  // Read the docs template and inject content
-  const templatePath = resolve("public", "docs.html");
-  if (existsSync(templatePath)) {
+  let html: string;
+  if (hasTemplate) {
+    // Read the docs template and inject content
     const template = readFileSync(templatePath, "utf-8");
-    res.send(template.replace("{{ content }}", htmlContent));
+    html = template.replace("{{ content }}", htmlContent);
   } else {
     // Inline fallback — same style as the original Jinja template
-    res.send(`<!DOCTYPE html>
+    html = `<!DOCTYPE html>
 <html lang="en"><head><meta charset="UTF-8"><title>OpenClaw Docs</title>
 <style>body{font-family:sans-serif;max-width:900px;margin:0 auto;padding:32px;background:#0a0a0f;color:#e0e0e8;}
-a{color:#818cf8;}</style></head><body>${htmlContent}</body></html>`);
+a{color:#818cf8;}</style></head><body>${htmlContent}</body></html>`;
   }
+
+  docsCache = { key, html };
+  return html;
+}
+
+// Docs page — render README.md as HTML in the docs template
+app.get("/docs", (_req, res) => {
+  const readmePath = resolve(BASE_DIR, "README.md");
+  if (!existsSync(readmePath)) {
+    res.status(404).send("Documentation not found");
+    return;
+  }
+
+  res.send(renderDocs(readmePath));
 });
 
 // Health check
@@ -209,7 +230,7 @@ app.post("/api/launch", async (req, res) => {
       if (iid in db.instances) {
         const existing = db.instances[iid];
         const cname = containerName(iid);
-        const status = await getContainerStatus(cname);
+        const status = await getContainerStatus(cname, true);
 
         if (status === "docker_unreachable") {
           return { code: 503, body: dockerUnreachableError() };
@@ -243,7 +264,7 @@ app.post("/api/launch", async (req, res) => {
           await startContainer(cname);
           // Wait a moment for container to start
           await new Promise((r) => setTimeout(r, 2000));
-          const newStatus = await getContainerStatus(cname);
+          const newStatus = await getContainerStatus(cname, true);
           existing.last_started = Math.floor(Date.now() / 1000);
           // Invalidate cache so next poll reflects new state
           statusCache.delete(iid);
@@ -598,7 +619,7 @@ app.get("/api/files/:iid", (req, res) => {
 });
 
 // Read a file
-app.get("/api/files/:iid/:filename", (req, res) => {
+app.get("/api/files/:iid/:filename", async (req, res) => {
   const { iid, filename } = req.params;
   if (!safeFilename(filename)) {
     res.status(400).json({ error: "Invalid filename" });
@@ -617,12 +638,12 @@ app.get("/api/files/:iid/:filename", (req, res) => {
     return;
   }
 
-  const content = readFileSync(filePath, "utf-8");
+  const content = await readFile(filePath, "utf-8");
   res.json({ content, filename, exists: true });
 });
 
 // Write a file (existing only)
-app.put("/api/files/:iid/:filename", (req, res) => {
+app.put("/api/files/:iid/:filename", async (req, res) => {
   const { iid, filename } = req.params;
   if (!safeFilename(filename)) {
     res.status(400).json({ error: "Invalid filename" });
@@ -642,7 +663,7 @@ app.put("/api/files/:iid/:filename", (req, res) => {
   }
 
   const content = req.body?.content ?? "";
-  writeFileSync(filePath, content);
+  await writeFile(filePath, content);
   res.json({ ok: true });
 });
 
@@ -700,6 +721,9 @@ const server = createServer(app);
 // WebSocket server for log streaming
 const wss = new WebSocketServer({ noServer: true });
 
+/** Bytes queued to a log-stream client before the docker log stream is paused. */
+const WS_LOG_HIGH_WATER = 1024 * 1024;
+
 server.on("upgrade", (request, socket, head) => {
   const url = request.url || "";
 
@@ -730,12 +754,17 @@ wss.on("connection", async (ws: WebSocket, _request: any, instanceId: string) =>
   let stream: NodeJS.ReadableStream | null = null;
 
   try {
-    stream = await streamContainerLogs(cname, 50);
+    const logs = await streamContainerLogs(cname, 50);
+    stream = logs;
 
     stream.on("data", (chunk: Buffer | string) => {
       if (ws.readyState !== WebSocket.OPEN) return;
       const text = typeof chunk === "string" ? chunk : chunk.toString("utf-8");
-      ws.send(text);
+      ws.send(text, () => {
+        if (logs.isPaused() && ws.bufferedAmount < WS_LOG_HIGH_WATER) logs.resume();
+      });
+      // Slow client — stop reading from dockerd until the socket drains
+      if (ws.bufferedAmount >= WS_LOG_HIGH_WATER) logs.pause();
     });
 
     stream.on("end", () => {